@@ -1,5 +1,5 @@
 # app.py
-# Eight → 宛名職人 変換 v1.4.3
+# Eight → 宛名職人 変換 v1.4.4
 # - トップページと /healthz に app / converter / address / textnorm / kana / 各辞書のバージョンを表示
 # - 会社名かな辞書（JP/EN）・人名辞書（フル/姓/名）・エリア局番のバージョン表示
 # - CSV/TSV 自動判定入力 → 変換 → CSV ダウンロード
@@ -10,6 +10,7 @@
 # - v1.4.2: JS submit handler の event 未定義バグ修正
 # - v1.4.3: レビューCSVが空になる問題を解消
 #            （headers/rows を script 内で直接 JS 配列として保持し、hidden JSON パース依存を廃止）
+# - v1.4.4: /convert は変換結果を直接 UTF-8 バイト列で受け取る（str 全体の encode を省略）
 
 import io
 import os
@@ -21,6 +22,7 @@ from flask import Flask, request, render_template_string, send_file, abort, json
 
 from services.eight_to_atena import (
     convert_eight_csv_text_to_atena_csv_text,
+    convert_eight_csv_text_to_atena_csv_bytes,
     __version__ as CONVERTER_VERSION,
     get_company_override_versions,
     get_person_dict_versions,
@@ -28,7 +30,7 @@ from services.eight_to_atena import (
     debug_company_kana,
 )
 
-VERSION = "v1.4.3"
+VERSION = "v1.4.4"
 
 INDEX_HTML = """
 <!doctype html>
@@ -331,11 +333,11 @@ def convert():
         abort(400, "文字コードは UTF-8 にしてください。")
 
     try:
-        out_csv_text = convert_eight_csv_text_to_atena_csv_text(text)
+        out_csv = convert_eight_csv_text_to_atena_csv_bytes(text)
     except Exception as e:
         abort(500, f"変換に失敗しました: {e}")
 
-    buf = io.BytesIO(out_csv_text.encode("utf-8"))
+    buf = io.BytesIO(out_csv)
     filename = f"atena_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     return send_file(
         buf,
@@ -1,19 +1,24 @@
 # -*- coding: utf-8 -*-
 # converters/address.py
 # 住所分割（辞書＋長語優先＋正規化 NFKC+lower）
-# v1.1.0
+# v1.2.0
 # - 基底ロジックは v17g と同一（最小修正）
 # - バージョン表記を数値系に変更（__version__ を追加）
 # - 住所2の先頭ダッシュ/空白除去（v17g 同様）
+# - split_address を lru_cache でメモ化（同一事業所の住所の繰り返し対策）
+# - split_address 内の正規表現をすべてモジュール読込時にコンパイル
+# - 階/室/号 等の有無判定を語ごとの in ループから単一 alternation の search へ
+# - 「○丁目○番○号」末尾の探索はマッチを list 化せず最後の非空マッチだけ保持
 from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Tuple, List
 
 from utils.textnorm import to_zenkaku, normalize_block_notation, load_bldg_words, bldg_words_version
 
-__version__ = "v1.1.0"
+__version__ = "v1.2.0"
 __meta__ = {
     "strategy": "dict+longest-first+nfkc+lower",
     "dict_version": None,
@@ -21,6 +26,8 @@ __meta__ = {
 
 # 建物以降を示唆する語
 FLOOR_ROOM = ["階", "Ｆ", "F", "フロア", "室", "号", "B1", "B2", "Ｂ１", "Ｂ２"]
+# 有無判定用（どれか 1 語でも含むか）。分割位置の決定は FLOOR_ROOM の並び順で行う
+_FLOOR_ROOM_RE = re.compile("|".join(map(re.escape, sorted(FLOOR_ROOM, key=len, reverse=True))))
 
 # 建物語辞書ロード（失敗時はミニマルフォールバック）
 try:
@@ -46,10 +53,6 @@ def _find_bldg_pos_norm(s: str) -> int:
             return pos
     return -1
 
-def _has_any_token(s: str, tokens: List[str]) -> bool:
-    s = s or ""
-    return any(t in s for t in tokens)
-
 # 住所2先頭に紛れ込んだダッシュ/空白の除去（安全化）
 _DASHES = " -‐-‒–—―ｰ−－"
 def _clean_right(s: str) -> str:
@@ -57,12 +60,40 @@ def _clean_right(s: str) -> str:
         return ""
     return to_zenkaku(s.lstrip(_DASHES))
 
+_WAJI_RE = re.compile(r"[一-龠ぁ-んァ-ヶｱ-ﾝー々〆ヵヶ]")
+_ALPHA_RE = re.compile(r"[A-Za-z]")
+
 def is_english_only(addr: str) -> bool:
     if not addr:
         return False
     # 和字が一つもなく英字を含む場合
-    return (not re.search(r"[一-龠ぁ-んァ-ヶｱ-ﾝー々〆ヵヶ]", addr)) and re.search(r"[A-Za-z]", addr)
-
+    return (not _WAJI_RE.search(addr)) and _ALPHA_RE.search(addr)
+
+# ---- split_address 用パターン（呼び出し毎のコンパイルを避けてここで一度だけ） ----
+_DASH = r"[‐\-‒–—―ｰ−－]"
+_NUM  = r"[0-9０-９]+"
+
+# 「…1-2-3 ␣ 10F/１０F/10階/10号 …」
+_PRE_3BLOCK_FLOOR_RE = re.compile(
+    rf"^(?P<base>.*?{_NUM}{_DASH}{_NUM}{_DASH}{_NUM})\s+(?P<fr>{_NUM}\s*(?:F|Ｆ|階|号).*)$"
+)
+# 3ブロック（+任意で部屋番号）＋テイル
+_3BLOCK_ROOM_TAIL_RE = re.compile(
+    rf"^(?P<base>.*?{_NUM}{_DASH}{_NUM}{_DASH}{_NUM})(?:{_DASH}(?P<room>{_NUM}))?(?P<tail>.*)$"
+)
+_2BLOCK_END_RE = re.compile(rf"^(?P<pre>.*?{_NUM}{_DASH}{_NUM})$")
+_3BLOCK_BLDG_RE = re.compile(rf"^(?P<pre>.*?{_NUM}{_DASH}{_NUM}{_DASH}{_NUM})(?P<bldg>.+)$")
+_2BLOCK_BLDG_RE = re.compile(rf"^(?P<pre>.*?{_NUM}{_DASH}{_NUM})(?P<bldg>.+)$")
+_3BLOCK_SPACE_RE = re.compile(rf"^(?P<pre>.*?{_NUM}{_DASH}{_NUM}{_DASH}{_NUM})[\s　]+(?P<bldg>.+)$")
+_2BLOCK_SPACE_RE = re.compile(rf"^(?P<pre>.*?{_NUM}{_DASH}{_NUM})[\s　]+(?P<bldg>.+)$")
+# 各要素が \d+ で始まるため、空でないマッチは必ず数字を含む
+_CHOME_BANCHI_RE = re.compile(r'(?:\d+丁目)?(?:\d+番地|\d+番)?(?:\d+号)?')
+
+_NON_DIGIT_HEAD_RE = re.compile(r"^[^\d０-９]")
+_DIGIT_HEAD_RE = re.compile(r"^\d")
+_FLOOR_MARK_RE = re.compile(r"(F|Ｆ|階|号)")
+
+@lru_cache(maxsize=4096)
 def split_address(addr: str) -> Tuple[str, str]:
     """
     住所文字列 → (住所1, 住所2) に分割して返す。
@@ -74,12 +105,7 @@ def split_address(addr: str) -> Tuple[str, str]:
     s_orig = addr.strip()
 
     # 早期分岐：「…1-2-3 ␣ 10F/１０F/10階/10号 …」パターンは確定分割
-    dash = r"[‐\-‒–—―ｰ−－]"
-    num  = r"[0-9０-９]+"
-    pre_3block_floor = re.compile(
-        rf"^(?P<base>.*?{num}{dash}{num}{dash}{num})\s+(?P<fr>{num}\s*(?:F|Ｆ|階|号).*)$"
-    )
-    m_pre = pre_3block_floor.match(s_orig)
+    m_pre = _PRE_3BLOCK_FLOOR_RE.match(s_orig)
     if m_pre:
         base = m_pre.group("base")
         fr   = m_pre.group("fr").strip()
@@ -92,12 +118,8 @@ def split_address(addr: str) -> Tuple[str, str]:
     if is_english_only(s):
         return "", to_zenkaku(s)
 
-    dash = r"[‐\-‒–—―ｰ−－]"
-    num  = r"[0-9０-９]+"
-
     # 3ブロック（+任意で部屋番号）＋テイル
-    p = re.compile(rf"^(?P<base>.*?{num}{dash}{num}{dash}{num})(?:{dash}(?P<room>{num}))?(?P<tail>.*)$")
-    m = p.match(s)
+    m = _3BLOCK_ROOM_TAIL_RE.match(s)
     if m:
         base = m.group("base")
         room = m.group("room") or ""
@@ -105,7 +127,7 @@ def split_address(addr: str) -> Tuple[str, str]:
 
         if tail:
             # tail 側が建物/階/号を示唆、または非数字始まりなら建物扱い
-            if _find_bldg_pos_norm(tail) >= 0 or _has_any_token(tail, FLOOR_ROOM) or re.match(r"^[^\d０-９]", tail):
+            if _find_bldg_pos_norm(tail) >= 0 or _FLOOR_ROOM_RE.search(tail) or _NON_DIGIT_HEAD_RE.match(tail):
                 return to_zenkaku(base), _clean_right((room or "") + tail)
 
         # base 内に建物語が潜んでいればそこで二分
@@ -121,50 +143,44 @@ def split_address(addr: str) -> Tuple[str, str]:
         return to_zenkaku(s), ""
 
     # 2ブロックで終端
-    p2_end = re.compile(rf"^(?P<pre>.*?{num}{dash}{num})$")
-    m2_end = p2_end.match(s)
+    m2_end = _2BLOCK_END_RE.match(s)
     if m2_end:
         return to_zenkaku(m2_end.group("pre")), ""
 
     # 3ブロック + 建物
-    p2 = re.compile(rf"^(?P<pre>.*?{num}{dash}{num}{dash}{num})(?P<bldg>.+)$")
-    m2 = p2.match(s)
+    m2 = _3BLOCK_BLDG_RE.match(s)
     if m2:
         return to_zenkaku(m2.group("pre")), _clean_right(m2.group("bldg").strip())
 
     # 2ブロック + 建物候補
-    p3 = re.compile(rf"^(?P<pre>.*?{num}{dash}{num})(?P<bldg>.+)$")
-    m3 = p3.match(s)
+    m3 = _2BLOCK_BLDG_RE.match(s)
     if m3:
         pre = m3.group("pre")
         bldg = m3.group("bldg").strip()
-        if (_find_bldg_pos_norm(bldg) >= 0) or _has_any_token(bldg, FLOOR_ROOM) or re.match(r"^[^\d０-９]", bldg):
+        if (_find_bldg_pos_norm(bldg) >= 0) or _FLOOR_ROOM_RE.search(bldg) or _NON_DIGIT_HEAD_RE.match(bldg):
             return to_zenkaku(pre), _clean_right(bldg)
-        if re.match(r"^\d", bldg) and re.search(r"(F|Ｆ|階|号)", bldg):
+        if _DIGIT_HEAD_RE.match(bldg) and _FLOOR_MARK_RE.search(bldg):
             return to_zenkaku(pre), to_zenkaku(bldg)
         return to_zenkaku(s), ""
 
     # スペース区切り（3ブロック or 2ブロック）
-    p_space3 = re.compile(rf"^(?P<pre>.*?{num}{dash}{num}{dash}{num})[\s　]+(?P<bldg>.+)$")
-    m_space3 = p_space3.match(s)
+    m_space3 = _3BLOCK_SPACE_RE.match(s)
     if m_space3:
         return to_zenkaku(m_space3.group("pre")), _clean_right(m_space3.group("bldg").strip())
 
-    p_space2 = re.compile(rf"^(?P<pre>.*?{num}{dash}{num})[\s　]+(?P<bldg>.+)$")
-    m_space2 = p_space2.match(s)
+    m_space2 = _2BLOCK_SPACE_RE.match(s)
     if m_space2:
         return to_zenkaku(m_space2.group("pre")), _clean_right(m_space2.group("bldg").strip())
 
     # 「○丁目○番○号」系の末尾位置で二分（後ろが残っていれば建物）
-    pat = r'(?:\d+丁目)?(?:\d+番地|\d+番)?(?:\d+号)?'
-    hits = list(re.finditer(pat, s))
-    for mm in reversed(hits):
-        if re.search(r'\d', mm.group(0)):
-            idx = mm.end()
-            rest = s[idx:].strip()
-            if rest:
-                return to_zenkaku(s[:idx]), _clean_right(rest)
-            break
+    last_end = -1
+    for mm in _CHOME_BANCHI_RE.finditer(s):
+        if mm.end() > mm.start():
+            last_end = mm.end()
+    if last_end >= 0:
+        rest = s[last_end:].strip()
+        if rest:
+            return to_zenkaku(s[:last_end]), _clean_right(rest)
 
     # 語彙による二分
     pos = _find_bldg_pos_norm(s)
@@ -1,5 +1,5 @@
 # services/eight_to_atena.py
-# Eight CSV/TSV → 宛名職人CSV 変換本体 v2.5.11
+# Eight CSV/TSV → 宛名職人CSV 変換本体 v2.6.0
 #
 # ベース方針
 # - 会社名かな：
@@ -21,6 +21,40 @@
 #     （英文法人格除去が常に有効になるよう統一）
 #   - _KANA_SYMBOLS_RE に () / （） を追加し、括弧のみ除去（中身は保持）
 #     （例：種と芽(個人事業主) → タネトメコジンジギョウヌシ）
+# v2.6.0:
+#   - 法人格（固定表記）除去を長い順の単一 alternation 正規表現に集約（1 パスで除去）
+#   - 純粋な文字列ヘルパ（電話/部署分割/法人格除去）を lru_cache でメモ化
+#   - カスタム列（メモ/備考フラグ）の取得を itemgetter に置換し、列スライスをループ外へ
+#   - 行変換をジェネレータ化し writerows へ直接流す（rows_out の全行保持を廃止）
+#   - DictReader をやめ csv.reader ＋ヘッダから一度だけ引いた列インデックスで参照
+#   - 部署の前半/後半分割を整数演算＋join のみに簡素化
+#   - 電話の数字抽出：ASCII 入力は translate の削除テーブルで 1 パス
+#   - CONVERT_JOBS>1 かつ CONVERT_PARALLEL_MIN_ROWS 行以上なら行チャンクをプロセス並列で変換
+#     （既定は直列。出力順は入力順のまま）
+#   - 出力行は空テンプレートの copy に必要な列だけ位置代入（ATENA_INDEX）
+#   - メモ1〜5 はスライス代入、6 件目以降の備考は join で連結
+#   - 部署区切り SEP_PATTERN を 1 文字 alternation から文字クラスへ
+#   - 法人格除去・辞書キー正規化の正規表現をモジュール読込時にコンパイル
+#   - convert_eight_csv_stream を追加（ファイル等へ 1 行ずつ書き出し、全文を StringIO に溜めない）
+#   - 可変セパレータ入り法人格も 1 本の alternation（語数の多い順）で 1 パス除去
+#     （「地方 独立 行政 法人」で「地方」が残る問題も解消）
+#   - 会社名かなの部分一致：トークン毎の比較ループを 1 本の alternation の match に置換
+#   - _company_kana 内の入れ子関数（英数判定/未一致区間の確定）をモジュールレベルへ
+#   - 電話の連結：中間リスト/seen 集合をやめ dict.fromkeys で順序付き重複排除
+#   - JP 辞書キー/スキャン用ビューの全角化は to_zenkaku_wide（translate）に委譲
+#   - 部分一致スキャンを _partial_kana_parts に集約し、debug_company_kana も同じ処理を使う
+#   - 出力ヘッダ行は読込時に一度だけ CSV 化した文字列をそのまま書く
+#   - _person_name_kana：重複分岐を統合し、辞書ヒット時は推測（to_katakana_guess）を呼ばない
+#   - 固定列がすべて揃うヘッダ（通常の Eight 出力）では itemgetter 1 回＋map(strip) で一括取得
+#   - 会社名かなを変換 1 回の中で会社名ごとにメモ化（同じ会社の名刺が並ぶケース）
+#   - 部分一致の結果は片ごとに記号除去済みのため、連結後の再クリーニングを省略
+#   - convert_eight_csv_text_to_atena_csv_bytes を追加（UTF-8 へ逐次エンコードしながら書き出す）
+#   - カスタム列の真偽判定をモジュール定数の frozenset（_TRUE_FLAGS）で
+#   - 市外局番の最長一致を全件走査から桁数別集合の引き当て（長い桁から最大 4 回）へ
+#   - 電話の数字抽出：非 ASCII 入力は NFKC 後に半角数字以外を 1 回で除去
+#     （全角数字の電話番号も半角化されて整形対象になる）
+#   - 区切り判定に失敗したらヘッダ行のタブ有無で決める（行長が不揃いな TSV を , 扱いしない）
+#   - 部署分割：区切りを含まない部署名（大半）は split/リスト生成をせずに返す
 
 from __future__ import annotations
 
@@ -28,16 +62,19 @@ import io
 import os
 import json
 import csv
-import math
+import itertools
+import multiprocessing
+import operator
 import re
-from typing import List, Tuple, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any, Optional, Callable, Iterable, Iterator
 
 from converters.address import split_address
 from utils.textnorm import to_zenkaku_wide, normalize_postcode
 from utils.jp_area_codes import AREA_CODES
 from utils.kana import to_katakana_guess as _to_kata
 
-__version__ = "v2.5.11"
+__version__ = "v2.6.0"
 
 # ===== 宛名職人ヘッダ（完全列） =====
 ATENA_HEADERS: List[str] = [
@@ -54,6 +91,32 @@ ATENA_HEADERS: List[str] = [
     "備考1","備考2","備考3","誕生日","性別","血液型","趣味","性格"
 ]
 
+# 出力ヘッダ行（固定なので csv.writer での整形は読込時に一度だけ）
+_buf = io.StringIO()
+csv.writer(_buf, lineterminator="\n").writerow(ATENA_HEADERS)
+_ATENA_HEADER_LINE = _buf.getvalue()
+del _buf
+
+# 列名 → 位置
+ATENA_INDEX: Dict[str, int] = {h: i for i, h in enumerate(ATENA_HEADERS)}
+
+# 全列空の行テンプレート（行ごとに copy し、値のある列だけ位置で埋める）
+_EMPTY_ROW: List[str] = [""] * len(ATENA_HEADERS)
+_I_LAST, _I_FIRST, _I_LAST_KANA, _I_FIRST_KANA, _I_FULL, _I_FULL_KANA = (
+    ATENA_INDEX[h] for h in ("姓", "名", "姓かな", "名かな", "姓名", "姓名かな")
+)
+_I_POST, _I_ADDR1, _I_ADDR2, _I_TEL, _I_EMAIL, _I_URL = (
+    ATENA_INDEX[h] for h in ("会社〒", "会社住所1", "会社住所2", "会社電話", "会社E-mail", "会社URL")
+)
+_I_COMPANY_KANA, _I_COMPANY, _I_DEPT1, _I_DEPT2, _I_TITLE = (
+    ATENA_INDEX[h] for h in ("会社名かな", "会社名", "部署名1", "部署名2", "役職名")
+)
+_I_MEMO1 = ATENA_INDEX["メモ1"]   # メモ1〜5 は連続
+_I_BIKO1 = ATENA_INDEX["備考1"]
+
+# カスタム列でフラグ ON とみなす値
+_TRUE_FLAGS = frozenset(("1", "1.0", "TRUE", "True", "true"))
+
 # Eight 固定ヘッダ
 EIGHT_FIXED = [
     "会社名","部署名","役職","姓","名","e-mail","郵便番号","住所","TEL会社",
@@ -65,39 +128,72 @@ EIGHT_FIXED = [
 def _clean_key(k: str) -> str:
     return (k or "").lstrip("\ufeff").strip()
 
-def _clean_row(row: dict) -> dict:
-    return {_clean_key(k): (v or "") for k, v in row.items()}
+def _cell(row: List[str], i: int) -> str:
+    """列インデックス i の値（列が無ければ空）。"""
+    return row[i].strip() if i >= 0 else ""
+
+def _fixed_reader(idx: List[int]) -> Callable[[List[str]], Iterable[str]]:
+    """
+    固定列 idx の値を strip 済みでまとめて返す関数を作る。
+    全列そろっていれば itemgetter 1 回＋map(str.strip)、欠けた列があれば _cell で空を補う。
+    """
+    if idx and min(idx) >= 0:
+        get = _multi_getter(idx)
+        return lambda row: map(str.strip, get(row))
+    return lambda row: [_cell(row, i) for i in idx]
+
+def _multi_getter(keys: List[Any]) -> Callable[[Any], tuple]:
+    """operator.itemgetter の『常にタプルを返す』版（0件/1件でも形を揃える）。"""
+    if not keys:
+        return lambda _row: ()
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda row: (row[key],)
+    return operator.itemgetter(*keys)
 
 # 部署の「前半/後半」分割（区切り：スペース/スラッシュ/中点/読点など）
-SEP_PATTERN = re.compile(r'(?:／|/|・|,|、|｜|\||\s)+')
+SEP_PATTERN = re.compile(r'[／/・,、｜|\s]+')
 
+@lru_cache(maxsize=4096)
 def _split_department_half(s: str) -> tuple[str, str]:
     s = (s or "").strip()
     if not s:
         return "", ""
+    if SEP_PATTERN.search(s) is None:
+        return s, ""  # 単一語（「営業部」等）
     tokens = [t for t in SEP_PATTERN.split(s) if t]
     if len(tokens) <= 1:
         return s, ""
-    n = len(tokens)
-    k = math.ceil(n / 2.0)
-    left = "　".join(tokens[:k])
-    right = "　".join(tokens[k:]) if k < n else ""
-    return left, right
+    k = (len(tokens) + 1) // 2  # 奇数個は前半を多めに
+    return "　".join(tokens[:k]), "　".join(tokens[k:])
 
 # ========== 電話整形（最長一致＋欠落0補正＋携帯3-4-4） ==========
 
 _MOBILE_PREFIXES = ("070", "080", "090")
 
+# ASCII の数字以外（ハイフン/括弧/空白/+ 等）を一括削除するテーブル
+_ASCII_NON_DIGITS = {cp: None for cp in range(128) if not chr(cp).isdigit()}
+_NON_ASCII_DIGITS_RE = re.compile(r"[^0-9]+")
+
 def _digits(s: str) -> str:
-    """全角/半角を問わず『数字だけ』を抽出。"""
-    return "".join(ch for ch in (s or "") if ch.isdigit())
+    """全角/半角を問わず『数字だけ』を半角で抽出。"""
+    s = s or ""
+    if s.isascii():
+        return s.translate(_ASCII_NON_DIGITS)
+    return _NON_ASCII_DIGITS_RE.sub("", _nfkc(s))
+
+# 市外局番を桁数ごとの集合に（長い桁から順に引けば最長一致になる）
+_AREA_BY_LEN: Tuple[Tuple[int, frozenset], ...] = tuple(
+    (n, frozenset(c for c in AREA_CODES if len(c) == n))
+    for n in sorted({len(c) for c in AREA_CODES}, reverse=True)
+)
 
 def _format_by_area(d: str) -> str:
     """'0' から始まる固定電話 d を AREA_CODES の最長一致でハイフン挿入。"""
     ac = None
-    for code in AREA_CODES:  # 定義側が長い順になっている想定
-        if d.startswith(code):
-            ac = code
+    for n, codes in _AREA_BY_LEN:
+        if d[:n] in codes:
+            ac = d[:n]
             break
     if not ac:
         if len(d) == 10 and d.startswith(("03", "06")):
@@ -118,6 +214,7 @@ def _format_by_area(d: str) -> str:
             return f"{ac}-{local[0:2]}-{local[2:5]}"
     return d
 
+@lru_cache(maxsize=8192)
 def _normalize_one_phone(raw: str) -> str:
     """単一フィールドを正規化。空or無効は空文字。"""
     if not raw or not raw.strip():
@@ -153,21 +250,8 @@ def _normalize_one_phone(raw: str) -> str:
     return d
 
 def _normalize_phone(*nums: str) -> str:
-    """複数フィールドを正規化し、重複排除して ';' 連結。"""
-    parts: List[str] = []
-    for raw in nums:
-        s = _normalize_one_phone(raw)
-        if s:
-            parts.append(s)
-
-    seen = set()
-    uniq: List[str] = []
-    for p in parts:
-        if p not in seen:
-            seen.add(p)
-            uniq.append(p)
-
-    return ";".join(uniq)
+    """複数フィールドを正規化し、重複排除（初出順）して ';' 連結。"""
+    return ";".join(dict.fromkeys(filter(None, map(_normalize_one_phone, nums))))
 
 # ========== かな生成：会社名・人名 ==========
 
@@ -197,6 +281,11 @@ _COMPANY_TYPES = [
     "合同会社","合資会社","合名会社","相互会社","清算株式会社",
 ]
 
+# 固定表記は『長い順』の alternation にまとめ、1 パスで除去する
+_COMPANY_TYPES_RE = re.compile(
+    "|".join(re.escape(t) for t in sorted(_COMPANY_TYPES, key=len, reverse=True) if t)
+)
+
 # セパレータを挟んでも1塊とみなすパターン
 _KANJI_TYPE_PATTERNS: List[Tuple[str, ...]] = [
     ("一般","社団","法人"),
@@ -220,28 +309,36 @@ _EN_TYPE_RE = re.compile(
     r'(?i)\b(?:co\.?,?\s*ltd\.?|co\.?|ltd\.?|inc\.?|incorporated|corp\.?|corporation|company|llc)\b\.?,?'
 )
 
+# 語数の多い順に並べ、同じ位置では長いパターンが勝つようにする
+_KANJI_TYPE_RE = re.compile("|".join(
+    _VAR_SEP_CLASS.join(map(re.escape, segs))
+    for segs in sorted(_KANJI_TYPE_PATTERNS, key=len, reverse=True)
+))
+
+# 前後ノイズ（セパレータ/括弧類）と連続空白
+_EDGE_NOISE_HEAD_RE = re.compile(r"^[\s\u3000\-‐─―－()\[\]【】／/・,，.．]+")
+_EDGE_NOISE_TAIL_RE = re.compile(r"[\s\u3000\-‐─―－()\[\]【】／/・,，.．]+$")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+
+@lru_cache(maxsize=4096)
 def _strip_company_type(name: str) -> str:
     base = (name or "").strip()
     if not base:
         return ""
 
     # 1) 日本語/固定表記：『長い順』で除去
-    for t in sorted(_COMPANY_TYPES, key=len, reverse=True):
-        if t and t in base:
-            base = base.replace(t, "")
+    base = _COMPANY_TYPES_RE.sub("", base)
 
     # 2) 英文法人格（ASCII対象）
     base = _EN_TYPE_RE.sub("", base)
 
     # 3) 可変セパレータ入りパターン
-    for segs in _KANJI_TYPE_PATTERNS:
-        pat = _VAR_SEP_CLASS.join(map(re.escape, segs))
-        base = re.sub(pat, "", base)
+    base = _KANJI_TYPE_RE.sub("", base)
 
     # 4) 前後ノイズ除去
-    base = re.sub(r"^[\s\u3000\-‐─―－()\[\]【】／/・,，.．]+", "", base)
-    base = re.sub(r"[\s\u3000\-‐─―－()\[\]【】／/・,，.．]+$", "", base)
-    base = re.sub(r"\s{2,}", " ", base)
+    base = _EDGE_NOISE_HEAD_RE.sub("", base)
+    base = _EDGE_NOISE_TAIL_RE.sub("", base)
+    base = _MULTI_SPACE_RE.sub(" ", base)
 
     return base
 
@@ -259,6 +356,9 @@ def _data_path(*rel: str) -> str:
     root = os.path.dirname(here)                        # repo root
     return os.path.join(root, *rel)
 
+_JP_SPACES_RE = re.compile(r"[ \t\u3000]+")
+_WS_RUN_RE = re.compile(r"\s+")
+
 def _normalize_for_jp_cfg(s: str, cfg: Dict[str, Any]) -> str:
     x = s or ""
     try:
@@ -269,22 +369,13 @@ def _normalize_for_jp_cfg(s: str, cfg: Dict[str, Any]) -> str:
     if cfg.get("strip_spaces"):
         x = x.strip()
     if cfg.get("collapse_spaces"):
-        x = re.sub(r"[ \t\u3000]+", " ", x)
+        x = _JP_SPACES_RE.sub(" ", x)
     if cfg.get("unify_middle_dot"):
         x = x.replace("・", "・")
     if cfg.get("unify_slash_to"):
         x = x.replace("/", cfg["unify_slash_to"]).replace("／", cfg["unify_slash_to"])
     if cfg.get("fullwidth_ascii"):
-        out = []
-        for ch in x:
-            oc = ord(ch)
-            if ch == " ":
-                out.append("\u3000")
-            elif 0x21 <= oc <= 0x7E:
-                out.append(chr(oc + 0xFEE0))
-            else:
-                out.append(ch)
-        x = "".join(out)
+        x = to_zenkaku_wide(x)
     return x
 
 def _normalize_for_en_cfg(s: str, cfg: Dict[str, Any]) -> str:
@@ -299,7 +390,7 @@ def _normalize_for_en_cfg(s: str, cfg: Dict[str, Any]) -> str:
     if cfg.get("strip_spaces"):
         x = x.strip()
     if cfg.get("collapse_spaces"):
-        x = re.sub(r"\s+", " ", x)
+        x = _WS_RUN_RE.sub(" ", x)
     if cfg.get("unify_slash_to"):
         x = x.replace("\\", "/").replace("／", "/")
     return x
@@ -319,16 +410,7 @@ def _scan_view_en(s: str) -> str:
 def _scan_view_jp(s: str) -> str:
     x = _nfkc(s)
     x = x.replace("/", "／").replace("\\", "／")
-    out = []
-    for ch in x:
-        oc = ord(ch)
-        if ch == " ":
-            out.append("\u3000")
-        elif 0x21 <= oc <= 0x7E:
-            out.append(chr(oc + 0xFEE0))
-        else:
-            out.append(ch)
-    return "".join(out)
+    return to_zenkaku_wide(x)
 
 _SEP_CHARS = set(" ／/・,&，,．.")
 
@@ -378,6 +460,128 @@ def _load_company_overrides() -> tuple[
 
 # ---- 会社名かな生成：左→右スキャン ----
 
+def _is_ascii_alnum(ch: str) -> bool:
+    return ("a" <= ch <= "z") or ("0" <= ch <= "9")
+
+def _flush_gap(gap_buf: List[str], out_parts: List[str]) -> None:
+    """未一致の文字を推測かなにして out_parts へ確定（空白だけなら捨てる）。"""
+    if not gap_buf:
+        return
+    seg = "".join(gap_buf)
+    gap_buf.clear()
+    if seg.strip():
+        out_parts.append(_clean_kana_symbols(_to_kata(seg)))
+
+# 直近に使った tokens 辞書ごとのスキャン用正規表現（辞書は変換 1 回につき 1 度ロードされる）
+_TOKEN_RE_CACHE: Dict[str, Tuple[Dict[str, str], int, Any, Any]] = {}
+
+def _token_res(kind: str, tokens: Dict[str, str], token_min: int) -> Tuple[Any, Any]:
+    """
+    tokens のキー（token_min 文字以上、長い順→辞書順）を 1 本の alternation にする。
+    戻り値は（素の RE, 直後が ASCII 英数字でないことを要求する RE）。キーが無ければ (None, None)。
+    alternation は先頭から順に試されるため、従来の「並び順で最初に一致したキー」と同じ結果になる。
+    """
+    hit = _TOKEN_RE_CACHE.get(kind)
+    if hit is not None and hit[0] is tokens and hit[1] == token_min:
+        return hit[2], hit[3]
+    keys = sorted((k for k in tokens.keys() if k and len(k) >= token_min), key=lambda x: (-len(x), x))
+    if keys:
+        alt = "|".join(map(re.escape, keys))
+        plain, bounded = re.compile(alt), re.compile(f"(?:{alt})(?![a-z0-9])")
+    else:
+        plain = bounded = None
+    _TOKEN_RE_CACHE[kind] = (tokens, token_min, plain, bounded)
+    return plain, bounded
+
+def _partial_kana_parts(stripped: str,
+                        jp_tokens: Dict[str, str] | None,
+                        en_tokens: Dict[str, str] | None,
+                        hits: List[Tuple[str, str]] | None = None) -> List[str]:
+    """
+    JP/EN tokens による左→右の最長部分一致スキャン。かな片のリストを返す（無効/無一致なら空）。
+    各片は _clean_kana_symbols 済み（記号なし・前後空白なし）なので、連結結果はそのまま使える。
+    hits を渡すと一致したトークンを (種別, キー) で記録する（debug_company_kana 用）。
+    """
+    if os.environ.get("COMPANY_PARTIAL_OVERRIDES", "1") in ("", "0", "false", "False"):
+        return []
+    token_min = int(os.environ.get("COMPANY_PARTIAL_TOKEN_MIN_LEN", "2") or "2")
+    allow_charwise = os.environ.get("PARTIAL_ACRONYM_CHARWISE", "1") not in ("", "0", "false", "False")
+    acronym_max = int(os.environ.get("PARTIAL_ACRONYM_MAX_LEN", "3") or "3")
+
+    view_en = _scan_view_en(stripped)
+    view_jp = _scan_view_jp(stripped)
+
+    jp_re = en_re = en_re_bounded = None
+    if jp_tokens:
+        jp_re, _ = _token_res("jp", jp_tokens, token_min)
+    if en_tokens:
+        en_re, en_re_bounded = _token_res("en", en_tokens, token_min)
+
+    n = len(stripped)
+    i = 0
+    out_parts: List[str] = []
+    gap_buf: List[str] = []
+
+    while i < n:
+        ch = stripped[i]
+
+        if _is_sep(ch):
+            _flush_gap(gap_buf, out_parts)
+            i += 1
+            continue
+
+        matched: Optional[Tuple[int, str]] = None
+
+        # JP tokens（endpos=n で元文字列の長さを超える一致を除外）
+        if jp_re is not None:
+            m = jp_re.match(view_jp, i, n)
+            if m:
+                matched = (m.end() - i, _clean_kana_symbols(jp_tokens[m.group()]))
+                if hits is not None:
+                    hits.append(("jp", m.group()))
+
+        # EN tokens（語境界：直前が英数字なら直後の境界を要求）
+        if matched is None and en_re is not None:
+            m = en_re.match(view_en, i, n)
+            if m and i > 0 and _is_ascii_alnum(view_en[i-1]):
+                m = en_re_bounded.match(view_en, i, n)
+            if m:
+                matched = (m.end() - i, _clean_kana_symbols(en_tokens[m.group()]))
+                if hits is not None:
+                    hits.append(("en", m.group()))
+
+        if matched is not None:
+            _flush_gap(gap_buf, out_parts)
+            tl, kana_piece = matched
+            out_parts.append(kana_piece)
+            i += tl
+            continue
+
+        # 英数字1文字ずつ（短い塊限定）
+        if allow_charwise and _is_ascii_alnum(view_en[i]) and en_tokens:
+            j = i
+            while j < n and _is_ascii_alnum(view_en[j]):
+                j += 1
+            run_len = j - i
+            if 1 <= run_len <= acronym_max:
+                _flush_gap(gap_buf, out_parts)
+                for k in range(i, j):
+                    ch_en = view_en[k]
+                    if ch_en in en_tokens:
+                        out_parts.append(_clean_kana_symbols(en_tokens[ch_en]))
+                        if hits is not None:
+                            hits.append(("en-char", ch_en))
+                    else:
+                        gap_buf.append(stripped[k])
+                i = j
+                continue
+
+        gap_buf.append(ch)
+        i += 1
+
+    _flush_gap(gap_buf, out_parts)
+    return out_parts
+
 def _company_kana(company_name: str,
                   jp_index: Dict[str, str], en_index: Dict[str, str],
                   jp_norm: Dict[str, Any], en_norm: Dict[str, Any],
@@ -402,103 +606,9 @@ def _company_kana(company_name: str,
         return _clean_kana_symbols(en_index[en_key])
 
     # 3) 部分一致（環境変数で ON/OFF）
-    if os.environ.get("COMPANY_PARTIAL_OVERRIDES", "1") not in ("", "0", "false", "False"):
-        token_min = int(os.environ.get("COMPANY_PARTIAL_TOKEN_MIN_LEN", "2") or "2")
-        allow_charwise = os.environ.get("PARTIAL_ACRONYM_CHARWISE", "1") not in ("", "0", "false", "False")
-        acronym_max = int(os.environ.get("PARTIAL_ACRONYM_MAX_LEN", "3") or "3")
-
-        view_en = _scan_view_en(stripped)
-        view_jp = _scan_view_jp(stripped)
-
-        en_keys: List[str] = []
-        jp_keys: List[str] = []
-        if en_tokens:
-            en_keys = [k for k in en_tokens.keys() if len(k) >= token_min]
-            en_keys.sort(key=lambda x: (-len(x), x))
-        if jp_tokens:
-            jp_keys = [k for k in jp_tokens.keys() if len(k) >= token_min]
-            jp_keys.sort(key=lambda x: (-len(x), x))
-
-        n = len(stripped)
-        i = 0
-        out_parts: List[str] = []
-        gap_buf: List[str] = []
-
-        def flush_gap():
-            if not gap_buf:
-                return
-            seg = "".join(gap_buf)
-            gap_buf.clear()
-            if seg.strip():
-                out_parts.append(_clean_kana_symbols(_to_kata(seg)))
-
-        def _is_ascii_alnum(ch: str) -> bool:
-            return ("a" <= ch <= "z") or ("0" <= ch <= "9")
-
-        while i < n:
-            ch = stripped[i]
-
-            if _is_sep(ch):
-                flush_gap()
-                i += 1
-                continue
-
-            matched: Optional[Tuple[int, str]] = None
-
-            # JP tokens
-            if jp_tokens:
-                for t in jp_keys:
-                    tl = len(t)
-                    if tl <= 0 or i + tl > n:
-                        continue
-                    if view_jp[i:i+tl] == t:
-                        matched = (tl, _clean_kana_symbols(jp_tokens[t]))
-                        break
-
-            # EN tokens（語境界）
-            if matched is None and en_tokens:
-                for t in en_keys:
-                    tl = len(t)
-                    if tl <= 0 or i + tl > n:
-                        continue
-                    if view_en[i:i+tl] != t:
-                        continue
-                    prev_ok = (i == 0) or not _is_ascii_alnum(view_en[i-1])
-                    next_ok = (i + tl == n) or not _is_ascii_alnum(view_en[i+tl])
-                    if prev_ok or next_ok:
-                        matched = (tl, _clean_kana_symbols(en_tokens[t]))
-                        break
-
-            if matched is not None:
-                flush_gap()
-                tl, kana_piece = matched
-                out_parts.append(kana_piece)
-                i += tl
-                continue
-
-            # 英数字1文字ずつ（短い塊限定）
-            if allow_charwise and _is_ascii_alnum(view_en[i]) and en_tokens:
-                j = i
-                while j < n and _is_ascii_alnum(view_en[j]):
-                    j += 1
-                run_len = j - i
-                if 1 <= run_len <= acronym_max:
-                    flush_gap()
-                    for k in range(i, j):
-                        ch_en = view_en[k]
-                        if ch_en in en_tokens:
-                            out_parts.append(_clean_kana_symbols(en_tokens[ch_en]))
-                        else:
-                            gap_buf.append(stripped[k])
-                    i = j
-                    continue
-
-            gap_buf.append(ch)
-            i += 1
-
-        flush_gap()
-        if out_parts:
-            return _clean_kana_symbols("".join(out_parts))
+    out_parts = _partial_kana_parts(stripped, jp_tokens, en_tokens)
+    if out_parts:
+        return "".join(out_parts)
 
     # 4) 全体推測
     return _clean_kana_symbols(_to_kata(stripped))
@@ -509,63 +619,53 @@ def _person_name_kana(last: str, first: str,
                       full_over: Dict[str, str],
                       surname_terms: Dict[str, str],
                       given_terms: Dict[str, str]) -> tuple[str, str, str]:
-    last = (last or "").strip()
-    first = (first or "").strip()
-    full = f"{last}{first}"
-
-    if full in full_over:
-        full_k = _clean_kana_symbols(full_over[full])
-        last_k = _clean_kana_symbols(surname_terms.get(last, _to_kata(last)))
-        first_k = _clean_kana_symbols(given_terms.get(first, _to_kata(first)))
-        return last_k, first_k, full_k
-
-    last_k = _clean_kana_symbols(surname_terms.get(last, _to_kata(last)))
-    first_k = _clean_kana_symbols(given_terms.get(first, _to_kata(first)))
-    full_name_kana = f"{last_k}{first_k}"
-    return last_k, first_k, full_name_kana
+    """姓/名は呼び出し側で strip 済みの前提。"""
+    last_k = surname_terms.get(last)
+    if last_k is None:
+        last_k = _to_kata(last)
+    first_k = given_terms.get(first)
+    if first_k is None:
+        first_k = _to_kata(first)
+    last_k = _clean_kana_symbols(last_k)
+    first_k = _clean_kana_symbols(first_k)
+
+    full_k = full_over.get(f"{last}{first}")
+    full_k = _clean_kana_symbols(full_k) if full_k is not None else f"{last_k}{first_k}"
+    return last_k, first_k, full_k
 
 # ========== 本体：Eight→宛名職人 ==========
 
-def convert_eight_csv_text_to_atena_csv_text(csv_text: str) -> str:
-    buf = io.StringIO(csv_text)
-    sample = buf.read(4096)
-    buf.seek(0)
-    try:
-        dialect = csv.Sniffer().sniff(sample, delimiters=[",", "\t"])
-    except Exception:
-        class _D:
-            delimiter = ","
-        dialect = _D()
-    reader = csv.DictReader(buf, dialect=dialect)
-    reader.fieldnames = [_clean_key(h) for h in (reader.fieldnames or [])]
-
+def _iter_atena_rows(reader: Iterator[List[str]], header: List[str]) -> Iterator[List[str]]:
+    """Eight の csv.reader（ヘッダ行は読み済み）から宛名職人の 1 行（ATENA_HEADERS 順）を順に生成する。"""
     JP_INDEX, EN_INDEX, JP_CFG, EN_CFG, JP_TOK, EN_TOK = _load_company_overrides()
     FULL_OVER, SURNAME_TERMS, GIVEN_TERMS = _load_person_dicts()
 
-    rows_out: List[List[str]] = []
-
-    for raw in reader:
-        row = _clean_row(raw)
-        g = lambda k: (row.get(_clean_key(k), "") or "").strip()
-
-        company_raw = g("会社名")
-        dept_raw    = g("部署名")
-        title_raw   = g("役職")
-        last        = g("姓")
-        first       = g("名")
-        email       = g("e-mail")
-        postcode    = normalize_postcode(g("郵便番号"))
-        addr_raw    = g("住所")
-        tel_company = g("TEL会社")
-        tel_dept    = g("TEL部門")
-        tel_direct  = g("TEL直通")
-        fax         = g("Fax")
-        mobile      = g("携帯電話")
-        url         = g("URL")
+    # 固定列の位置はヘッダから 1 回だけ引く（同名列は DictReader 同様に後勝ち／無い列は -1）
+    col = {h: i for i, h in enumerate(header)}
+    # 名刺交換日（末尾）は出力に使わない
+    read_fixed = _fixed_reader([col.get(h, -1) for h in EIGHT_FIXED[:-1]])
+
+    # カスタム列（固定列より後ろ）は行に依らないので 1 回だけ求める
+    tail_headers = header[len(EIGHT_FIXED):]
+    get_tail = _multi_getter(list(range(len(EIGHT_FIXED), len(header))))
+    width = len(header)
+    new_row = _EMPTY_ROW.copy  # ループ内の属性解決を避ける
+    # 会社名 → かな（辞書は変換ごとにロードするため、メモもこの変換の間だけ有効）
+    company_kana_memo: Dict[str, str] = {}
+
+    for row in reader:
+        if not row:
+            continue  # 空行は読み飛ばす（DictReader と同じ扱い）
+        if len(row) < width:
+            row += [""] * (width - len(row))
+
+        (company_raw, dept_raw, title_raw, last, first, email, postcode_raw, addr_raw,
+         tel_company, tel_dept, tel_direct, fax, mobile, url) = read_fixed(row)
+        postcode = normalize_postcode(postcode_raw)
 
         # 住所は会社住所としてのみ使用（自宅欄は空）
         a1, a2 = split_address(addr_raw)
-        if (a2 or "").strip():
+        if a2.strip():
             company_addr1_raw, company_addr2_raw = a1, a2
         else:
             company_addr1_raw, company_addr2_raw = addr_raw, ""
@@ -582,7 +682,10 @@ def convert_eight_csv_text_to_atena_csv_text(csv_text: str) -> str:
         title = to_zenkaku_wide(title_raw)
 
         # かな用は「生の company_raw 」を使う（英文法人格除去を確実に効かせる）
-        company_kana = _company_kana(company_raw, JP_INDEX, EN_INDEX, JP_CFG, EN_CFG, JP_TOK, EN_TOK) or ""
+        company_kana = company_kana_memo.get(company_raw)
+        if company_kana is None:
+            company_kana = _company_kana(company_raw, JP_INDEX, EN_INDEX, JP_CFG, EN_CFG, JP_TOK, EN_TOK)
+            company_kana_memo[company_raw] = company_kana
 
         last_kana, first_kana, full_name_kana = _person_name_kana(
             last, first, FULL_OVER, SURNAME_TERMS, GIVEN_TERMS
@@ -590,67 +693,116 @@ def convert_eight_csv_text_to_atena_csv_text(csv_text: str) -> str:
         full_name = f"{last}{first}"
 
         # カスタム列 → メモ/備考
-        fn_clean = reader.fieldnames or []
-        tail_headers = fn_clean[len(EIGHT_FIXED):]
-        flags: List[str] = []
-        for hdr in tail_headers:
-            val = (row.get(hdr, "") or "").strip()
-            if val in ("1", "1.0", "TRUE", "True", "true"):
-                flags.append(hdr)
-
-        memo = ["", "", "", "", ""]
-        biko = ""
-        for i, hdr in enumerate(flags):
-            if i < 5:
-                memo[i] = hdr
-            else:
-                biko += (("\n" if biko else "") + hdr)
-
-        out_row: List[str] = [
-            # 姓・名
-            last, first,
-            last_kana, first_kana,
-            full_name, full_name_kana,
-            # ミドルネーム系
-            "", "", "",
-            # ニックネーム / 旧姓 / 宛先
-            "", "", "",
-            # 自宅（空）
-            "", "", "", "", "",
-            "", "", "", "",
-            # 会社
-            postcode, company_addr1, company_addr2, "",
-            phone_join, "", email,
-            url, "",
-            # その他（空）
-            "", "", "", "", "", "", "", "", "",
-            # 会社名・部署・役職
-            company_kana, company_disp,
-            dept1, dept2,
-            title,
-            # 連名
-            "", "", "", "",
-            # メモ
-            memo[0], memo[1], memo[2], memo[3], memo[4],
-            # 備考
-            biko, "", "",
-            # 誕生日〜
-            "", "", "", "", ""
+        flags: List[str] = [
+            hdr for hdr, val in zip(tail_headers, get_tail(row))
+            if val.strip() in _TRUE_FLAGS
         ]
+        n_memo = min(len(flags), 5)
+
+        # 自宅・その他・連名・誕生日〜 等は空のまま（テンプレートの ""）
+        out_row = new_row()
+        # 姓・名
+        out_row[_I_LAST] = last
+        out_row[_I_FIRST] = first
+        out_row[_I_LAST_KANA] = last_kana
+        out_row[_I_FIRST_KANA] = first_kana
+        out_row[_I_FULL] = full_name
+        out_row[_I_FULL_KANA] = full_name_kana
+        # 会社
+        out_row[_I_POST] = postcode
+        out_row[_I_ADDR1] = company_addr1
+        out_row[_I_ADDR2] = company_addr2
+        out_row[_I_TEL] = phone_join
+        out_row[_I_EMAIL] = email
+        out_row[_I_URL] = url
+        # 会社名・部署・役職
+        out_row[_I_COMPANY_KANA] = company_kana
+        out_row[_I_COMPANY] = company_disp
+        out_row[_I_DEPT1] = dept1
+        out_row[_I_DEPT2] = dept2
+        out_row[_I_TITLE] = title
+        # メモ（先頭 5 件）/ 備考（6 件目以降を改行連結）
+        out_row[_I_MEMO1:_I_MEMO1 + n_memo] = flags[:n_memo]
+        out_row[_I_BIKO1] = "\n".join(flags[5:])
+
+        yield out_row
+
+# ---- 大量行の並列変換（環境変数で ON） ----
+
+_PARALLEL_CHUNK_ROWS = 1000
+
+def _convert_chunk(args: Tuple[List[List[str]], List[str]]) -> List[List[str]]:
+    rows, header = args
+    return list(_iter_atena_rows(iter(rows), header))
+
+def _iter_chunks(rows: Iterator[List[str]], header: List[str], size: int):
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk, header
+
+def _iter_atena_rows_auto(reader: Iterator[List[str]], header: List[str]) -> Iterator[List[str]]:
+    """CONVERT_JOBS>1 かつ行数が閾値以上なら行チャンクをプロセス並列で変換（出力順は維持）。"""
+    jobs = int(os.environ.get("CONVERT_JOBS", "1") or "1")
+    if jobs <= 1:
+        yield from _iter_atena_rows(reader, header)
+        return
+
+    min_rows = int(os.environ.get("CONVERT_PARALLEL_MIN_ROWS", "2000") or "2000")
+    head = list(itertools.islice(reader, min_rows))
+    if len(head) < min_rows:
+        yield from _iter_atena_rows(iter(head), header)
+        return
+
+    rows = itertools.chain(head, reader)
+    with multiprocessing.Pool(jobs) as pool:
+        for out_rows in pool.imap(_convert_chunk, _iter_chunks(rows, header, _PARALLEL_CHUNK_ROWS)):
+            yield from out_rows
+
+# 区切り（, / タブ）判定に使う先頭サンプルの文字数
+_SNIFF_SAMPLE_CHARS = 4096
+
+def _open_eight_reader(in_fp) -> Tuple[Iterator[List[str]], List[str]]:
+    """
+    テキストストリーム in_fp（Eight CSV/TSV）から (csv.reader, 正規化済みヘッダ) を作る。
+    in_fp はシーク不要（先頭サンプルで区切りを判定し、読んだ分はそのまま行として使う）。
+    """
+    sample = in_fp.read(_SNIFF_SAMPLE_CHARS)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=[",", "\t"])
+    except Exception:
+        # 短い行/空行が混ざると Sniffer は一貫性不足で判定を諦める。ヘッダ行（1 行目）で決める
+        class _D:
+            delimiter = "\t" if "\t" in sample.split("\n", 1)[0] else ","
+        dialect = _D()
+    # サンプル末尾の途中行は readline で補ってから残りへつなぐ
+    lines = itertools.chain(io.StringIO(sample + in_fp.readline()), in_fp)
+    reader = csv.reader(lines, dialect=dialect)
+    header = [_clean_key(h) for h in next(reader, [])]
+    return reader, header
+
+def convert_eight_csv_stream(in_fp, out_fp) -> None:
+    """テキストストリーム in_fp（Eight CSV/TSV）を読み、宛名職人CSV を out_fp へ 1 行ずつ書き出す。"""
+    reader, header = _open_eight_reader(in_fp)
+    out_fp.write(_ATENA_HEADER_LINE)
+    w = csv.writer(out_fp, lineterminator="\n")
+    w.writerows(_iter_atena_rows_auto(reader, header))
 
-        if len(out_row) != len(ATENA_HEADERS):
-            raise ValueError(
-                f"出力列数がヘッダと不一致: row={len(out_row)} headers={len(ATENA_HEADERS)}"
-            )
-
-        rows_out.append(out_row)
-
+def convert_eight_csv_text_to_atena_csv_text(csv_text: str) -> str:
     out = io.StringIO()
-    w = csv.writer(out, lineterminator="\n")
-    w.writerow(ATENA_HEADERS)
-    w.writerows(rows_out)
+    convert_eight_csv_stream(io.StringIO(csv_text), out)
     return out.getvalue()
 
+def convert_eight_csv_text_to_atena_csv_bytes(csv_text: str) -> bytes:
+    """UTF-8 の CSV バイト列を返す（ダウンロード用。全文の str を作ってから encode しない）。"""
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="utf-8", newline="", write_through=True)
+    convert_eight_csv_stream(io.StringIO(csv_text), out)
+    out.flush()
+    out.detach()  # raw を閉じずにラッパだけ外す
+    return raw.getvalue()
+
 # ==== version reporting helpers ====
 
 def _read_json_version(*relative_candidate_paths: str) -> str | None:
@@ -727,96 +879,10 @@ def debug_company_kana(name: str) -> Dict[str, Any]:
         kana = _clean_kana_symbols(EN_INDEX[en_key])
         hits["full"] = ("en", en_key)
     else:
-        if os.environ.get("COMPANY_PARTIAL_OVERRIDES", "1") not in ("", "0", "false", "False"):
-            token_min = int(os.environ.get("COMPANY_PARTIAL_TOKEN_MIN_LEN", "2") or "2")
-            allow_charwise = os.environ.get("PARTIAL_ACRONYM_CHARWISE", "1") not in ("", "0", "false", "False")
-            acronym_max = int(os.environ.get("PARTIAL_ACRONYM_MAX_LEN", "3") or "3")
-
-            view_en = _scan_view_en(stripped)
-            view_jp = _scan_view_jp(stripped)
-
-            en_keys: List[str] = []
-            jp_keys: List[str] = []
-            if EN_TOK:
-                en_keys = [k for k in EN_TOK.keys() if len(k) >= token_min]
-                en_keys.sort(key=lambda x: (-len(x), x))
-            if JP_TOK:
-                jp_keys = [k for k in JP_TOK.keys() if len(k) >= token_min]
-                jp_keys.sort(key=lambda x: (-len(x), x))
-
-            n = len(stripped)
-            i = 0
-            out_parts: List[str] = []
-            gap_buf: List[str] = []
-
-            def flush_gap():
-                if gap_buf:
-                    seg = "".join(gap_buf)
-                    gap_buf.clear()
-                    if seg.strip():
-                        out_parts.append(_clean_kana_symbols(_to_kata(seg)))
-
-            def _is_ascii_alnum(ch: str) -> bool:
-                return ("a" <= ch <= "z") or ("0" <= ch <= "9")
-
-            while i < n:
-                ch = stripped[i]
-                if _is_sep(ch):
-                    flush_gap()
-                    i += 1
-                    continue
-
-                matched = None
-
-                if JP_TOK:
-                    for t in jp_keys:
-                        tl = len(t)
-                        if tl > 0 and i + tl <= n and view_jp[i:i+tl] == t:
-                            matched = ("jp", t, tl, _clean_kana_symbols(JP_TOK[t]))
-                            break
-
-                if matched is None and EN_TOK:
-                    for t in en_keys:
-                        tl = len(t)
-                        if tl > 0 and i + tl <= n and view_en[i:i+tl] == t:
-                            prev_ok = (i == 0) or not _is_ascii_alnum(view_en[i-1])
-                            next_ok = (i + tl == n) or not _is_ascii_alnum(view_en[i+tl])
-                            if prev_ok or next_ok:
-                                matched = ("en", t, tl, _clean_kana_symbols(EN_TOK[t]))
-                                break
-
-                if matched is not None:
-                    flush_gap()
-                    tag, t, tl, kana_piece = matched
-                    out_parts.append(kana_piece)
-                    hits["partial"].append((tag, t))
-                    i += tl
-                    continue
-
-                if allow_charwise and view_en[i].isalnum() and EN_TOK:
-                    j = i
-                    while j < n and view_en[j].isalnum():
-                        j += 1
-                    run_len = j - i
-                    if 1 <= run_len <= acronym_max:
-                        flush_gap()
-                        for k in range(i, j):
-                            ch_en = view_en[k]
-                            if ch_en in EN_TOK:
-                                out_parts.append(_clean_kana_symbols(EN_TOK[ch_en]))
-                                hits["partial"].append(("en-char", ch_en))
-                            else:
-                                gap_buf.append(stripped[k])
-                        i = j
-                        continue
-
-                gap_buf.append(ch)
-                i += 1
-
-            flush_gap()
-            if out_parts:
-                route = "partial"
-                kana = _clean_kana_symbols("".join(out_parts))
+        out_parts = _partial_kana_parts(stripped, JP_TOK, EN_TOK, hits["partial"])
+        if out_parts:
+            route = "partial"
+            kana = "".join(out_parts)
 
     if route is None:
         route = "guess"
@@ -0,0 +1,91 @@
+import csv
+import io
+
+from services import eight_to_atena as m
+from services.eight_to_atena import (
+    ATENA_HEADERS,
+    _normalize_phone,
+    _strip_company_type,
+    convert_eight_csv_stream,
+    convert_eight_csv_text_to_atena_csv_bytes,
+    convert_eight_csv_text_to_atena_csv_text,
+)
+
+def test_strip_company_type_longest_first():
+    assert _strip_company_type("医療法人社団 健康会") == "健康会"
+    assert _strip_company_type("株式会社新潮社") == "新潮社"
+    assert _strip_company_type("(株)富士通") == "富士通"
+    assert _strip_company_type("地方 独立 行政 法人 東京病院") == "東京病院"
+
+def test_strip_company_type_english():
+    assert _strip_company_type("PRONEWS Co., LTD.") == "PRONEWS"
+    assert _strip_company_type("Japan Broadcasting Corporation") == "Japan Broadcasting"
+
+def test_normalize_phone_fullwidth():
+    assert _normalize_phone("０３（１２３４）５６７８", "０９０－１２３４－５６７８") == "03-1234-5678;090-1234-5678"
+
+def _convert_rows(text):
+    out = convert_eight_csv_text_to_atena_csv_text(text)
+    rows = list(csv.reader(io.StringIO(out)))
+    assert rows[0] == ATENA_HEADERS
+    return [dict(zip(ATENA_HEADERS, r)) for r in rows[1:]]
+
+def test_convert_fixed_and_flag_columns():
+    text = (
+        "﻿会社名,部署名,役職,姓,名,e-mail,郵便番号,住所,TEL会社,TEL部門,TEL直通,Fax,携帯電話,URL,名刺交換日,A,B,C,D,E,F\n"
+        "株式会社新潮社,営業部 第一課,部長,田中,太郎,t@example.com,1000005,東京都千代田区丸の内1-2-3 10F,"
+        "0312345678,,,0312345678,9012345678,https://x.jp,2024/01/01,1,,TRUE,1,1,1\n"
+        "\n"
+        "短い行,総務部\n"
+    )
+    rows = _convert_rows(text)
+    assert len(rows) == 2
+    r = rows[0]
+    assert r["会社名"] == "株式会社新潮社"
+    assert r["会社名かな"] == "シンチョウシャ"
+    assert (r["部署名1"], r["部署名2"]) == ("営業部", "第一課")
+    assert r["会社〒"] == "100-0005"
+    assert r["会社電話"] == "03-1234-5678;090-1234-5678"
+    assert [r[f"メモ{i}"] for i in range(1, 6)] == ["A", "C", "D", "E", "F"]
+    assert r["備考1"] == ""
+    assert rows[1]["会社名"] == "短い行"
+    assert rows[1]["姓"] == ""
+
+def test_convert_stream_matches_text(tmp_path):
+    header = "会社名\t部署名\t役職\t姓\t名\n"
+    body = "".join(f"株式会社新潮社\t営業部\t部長\t田中\t太郎{i}\n" for i in range(300))
+    src = tmp_path / "in.tsv"
+    src.write_text(header + body, encoding="utf-8")
+    dst = tmp_path / "out.csv"
+    with open(src, encoding="utf-8", newline="") as fi, open(dst, "w", encoding="utf-8", newline="") as fo:
+        convert_eight_csv_stream(fi, fo)
+    assert dst.read_text(encoding="utf-8") == convert_eight_csv_text_to_atena_csv_text(header + body)
+
+def test_convert_bytes_matches_text():
+    text = "会社名,部署名,役職,姓,名\n株式会社新潮社,営業部,部長,田中,太郎\n"
+    assert convert_eight_csv_text_to_atena_csv_bytes(text) == convert_eight_csv_text_to_atena_csv_text(text).encode("utf-8")
+
+def test_convert_parallel_matches_serial(monkeypatch):
+    header = "会社名,部署名,役職,姓,名,e-mail,郵便番号,住所,TEL会社,TEL部門,TEL直通,Fax,携帯電話,URL,名刺交換日,A\n"
+    body = "".join(
+        f"株式会社新潮社,営業部,部長,田中,太郎{i},,1000005,大阪府大阪市北区梅田3-1-{i},0312345678,,,,,,,{i % 2}\n"
+        for i in range(25)
+    )
+    serial = convert_eight_csv_text_to_atena_csv_text(header + body)
+
+    monkeypatch.setenv("CONVERT_JOBS", "2")
+    monkeypatch.setenv("CONVERT_PARALLEL_MIN_ROWS", "10")
+    monkeypatch.setattr(m, "_PARALLEL_CHUNK_ROWS", 7)
+    assert convert_eight_csv_text_to_atena_csv_text(header + body) == serial
+
+def test_convert_ragged_tsv_detects_tab():
+    # 短い行が混ざる TSV は Sniffer が判定を諦める。ヘッダ行のタブで TSV と判定されること
+    header = "会社名\t部署名\t役職\t姓\t名\te-mail\t郵便番号\t住所\tTEL会社\tURL\tタグA\tタグB\n"
+    full = "株式会社新潮社\t営業部\t部長\t田中\t太郎\t\t1000005\t東京都千代田区丸の内1-2-{0}\t0312345678\thttps://x.jp\t1\t\n"
+    short = "株式会社新潮社\t営業部\tCEO\t田中\t花子\n"
+    body = "".join((short if i % 6 == 5 else full).format(i) for i in range(30))
+    rows = _convert_rows(header + body)
+    assert len(rows) == 30
+    assert rows[0]["会社名"] == "株式会社新潮社"
+    assert rows[0]["会社〒"] == "100-0005"
+    assert rows[5]["名"] == "花子"
@@ -1,11 +1,19 @@
 # utils/kana.py
-# かな付与ユーティリティ（常にカタカナで返す） v1.1
+# かな付与ユーティリティ（常にカタカナで返す） v1.3
+# v1.2: to_katakana_guess を lru_cache でメモ化（同姓・同社名の繰り返しを辞書引きに）
+#       フォールバック経路の二重 NFKC を除去
+#       _hira_to_kata を str.translate 化
+# v1.3: ASCII のみの入力は NFKC/日本語判定を通さずそのまま返す
+#       _is_japanese_text を文字ごとの any() から事前コンパイル文字クラスの search へ
+#       カタカナ（ァ〜ヺ・ー）のみの入力は pykakasi を通さずそのまま返す
 from __future__ import annotations
 
+import re
 import unicodedata
+from functools import lru_cache
 from typing import List, Tuple
 
-__version__ = "v1.1"
+__version__ = "v1.3"
 
 # pykakasi 利用可否を判定
 try:
@@ -33,31 +41,32 @@ def engine_detail() -> List[str]:
 _HIRA_START = ord("ぁ")
 _HIRA_END   = ord("ゖ")  # 〻 は含めない
 _KATA_OFFSET = ord("ァ") - ord("ぁ")  # 0x30A1 - 0x3041 = 0x60
+_HIRA_TO_KATA = {cp: cp + _KATA_OFFSET for cp in range(_HIRA_START, _HIRA_END + 1)}
 
 def _hira_to_kata(s: str) -> str:
-    """ひらがな→カタカナ（その他はそのまま）。"""
-    out_chars = []
-    for ch in s:
-        oc = ord(ch)
-        if _HIRA_START <= oc <= _HIRA_END:
-            out_chars.append(chr(oc + _KATA_OFFSET))
-        else:
-            out_chars.append(ch)
-    return "".join(out_chars)
+    """ひらがな→カタカナ（その他はそのまま）。str.translate で 1 パス変換。"""
+    return s.translate(_HIRA_TO_KATA)
 
 def _to_fullwidth(s: str) -> str:
     """半角カナ等を含む文字列を NFKC で全角寄せ。"""
     return unicodedata.normalize("NFKC", s or "")
 
+# 漢字（一〜龥）/ ひらがな（ぁ〜ゟ）/ カタカナ（゠〜ヿ）
+_JP_CHAR_RE = re.compile("[一-龥ぁ-ゟ゠-ヿ]")
+
+# 読み推定しても変わらない「カタカナのみ」（pykakasi の往復で不変な範囲）
+_KATAKANA_ONLY_RE = re.compile("[ァ-ヺー]+")
+
 def _is_japanese_text(s: str) -> bool:
     """漢字/かなを1文字でも含むかの簡易判定。"""
     if not s:
         return False
-    return any("一" <= ch <= "龥" or "ぁ" <= ch <= "ゟ" or "゠" <= ch <= "ヿ" for ch in s)
+    return _JP_CHAR_RE.search(s) is not None
 
 # --------------------------
 # 公開API
 # --------------------------
+@lru_cache(maxsize=8192)
 def to_katakana_guess(s: str) -> str:
     """
     入力文字列 s の読みを推定し、常に『カタカナ（全角）』で返す。
@@ -70,9 +79,17 @@ def to_katakana_guess(s: str) -> str:
         return ""
 
     x = str(s)
+    # ASCII のみ（英数社名など）は NFKC も読み推定も素通しになるので即返す
+    if x.isascii():
+        return x
+
     # まずは全体をNFKCで正規化（半角カナ→全角など）
     x = _to_fullwidth(x)
 
+    # 既にカタカナだけなら読み推定は不要
+    if _KATAKANA_ONLY_RE.fullmatch(x):
+        return x
+
     # pykakasi が使え、かつ日本語が含まれるときは読み推定
     if _KAKASI_AVAILABLE and _is_japanese_text(x):
         try:
@@ -86,4 +103,5 @@ def to_katakana_guess(s: str) -> str:
             pass
 
     # フォールバック：既存のかなはカタカナに揃える。英数はそのまま（辞書側で対応）
-    return _to_fullwidth(_hira_to_kata(x))
+    # x は冒頭で NFKC 済みのため、ひらがな→カタカナ後の再正規化は不要
+    return _hira_to_kata(x)
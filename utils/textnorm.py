@@ -1,15 +1,22 @@
 # -*- coding: utf-8 -*-
-# utils/textnorm.py v1.16
+# utils/textnorm.py v1.18
 # 文字種正規化・番地表記正規化・辞書ロード＆辞書バージョン問い合わせ
+# v1.17: to_zenkaku_wide / normalize_postcode を lru_cache でメモ化
+#        to_zenkaku_wide は対象文字（ASCII 可視/スペース）が無ければ即返す
+#        normalize_block_notation の置換ルールを事前コンパイル
+# v1.18: to_zenkaku_wide を 1 文字ずつのループから str.translate（事前構築テーブル）へ
+#        （対象文字が無ければ即返す早期リターンは v1.17 のまま維持）
+#        normalize_postcode の数字抽出を事前コンパイルの非数字除去 1 回に
 from __future__ import annotations
 
 import json
 import os
 import re
 import unicodedata
+from functools import lru_cache
 from typing import List, Any, Optional
 
-__version__ = "v1.16"
+__version__ = "v1.18"
 __meta__ = {
     "features": [
         "to_zenkaku (NFKC)",
@@ -37,6 +44,14 @@ def to_zenkaku(s: str) -> str:
         return ""
     return unicodedata.normalize("NFKC", s)
 
+# to_zenkaku_wide の変換対象（スペース＋ASCII 可視文字）
+_ASCII_WIDE_TARGET_RE = re.compile(r"[\x20-\x7e]")
+
+# to_zenkaku_wide の変換表（スペース→全角スペース、ASCII 可視文字→+0xFEE0）
+_ZEN_WIDE_MAP = {0x20: 0x3000}
+_ZEN_WIDE_MAP.update({oc: oc + 0xFEE0 for oc in range(0x21, 0x7F)})
+
+@lru_cache(maxsize=8192)
 def to_zenkaku_wide(s: str) -> str:
     """
     ASCII 可視文字(0x21-0x7E)とスペースを『全角』に寄せる。
@@ -44,20 +59,16 @@ def to_zenkaku_wide(s: str) -> str:
     """
     if not s:
         return ""
-    out = []
-    for ch in s:
-        oc = ord(ch)
-        if ch == " ":
-            out.append("\u3000")
-        elif 0x21 <= oc <= 0x7E:
-            out.append(chr(oc + 0xFEE0))
-        else:
-            out.append(ch)
-    return "".join(out)
+    if not _ASCII_WIDE_TARGET_RE.search(s):
+        return s  # 和文のみ等、変換対象が無ければそのまま
+    return s.translate(_ZEN_WIDE_MAP)
 
 # ----------------------------
 # 郵便番号・ブロック表記
 # ----------------------------
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+@lru_cache(maxsize=4096)
 def normalize_postcode(s: str) -> str:
     """
     郵便番号を ###-#### で返す（7桁以外は空）。
@@ -65,8 +76,7 @@ def normalize_postcode(s: str) -> str:
     """
     if not s:
         return ""
-    x = to_zenkaku(s)
-    digits = "".join(ch for ch in x if ch.isdigit())
+    digits = _NON_DIGIT_RE.sub("", to_zenkaku(s))
     if len(digits) != 7:
         return ""
     return digits[:3] + "-" + digits[3:]
@@ -84,14 +94,15 @@ _DEF_REPLACERS = [
     (r"-{2,}", "-"),
     (r"(^-|-$)", ""),
 ]
+_DEF_REPLACERS_RE = [(re.compile(pat), rep) for pat, rep in _DEF_REPLACERS]
 
 def normalize_block_notation(s: str) -> str:
     """町丁目・番地・号などのブロック表記をハイフン連結へ寄せる簡易正規化。"""
     if not s:
         return ""
     x = to_zenkaku(s)
-    for pat, rep in _DEF_REPLACERS:
-        x = re.sub(pat, rep, x)
+    for pat, rep in _DEF_REPLACERS_RE:
+        x = pat.sub(rep, x)
     return x
 
 # ----------------------------